@@ -2,6 +2,11 @@ import os
 import json
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DASHBOARD_STATE_PATH = os.getenv("SIA_DASHBOARD_STATE_PATH", "./sia_data/dashboard_state.json")
 USER_PREFS_PATH = os.getenv("SIA_USER_PREFS_PATH", "./sia_data/user_prefs.json")
 
@@ -26,17 +31,31 @@ def load_user_preferences(path: Optional[str] = None) -> Dict[str, Any]:
     return _load_json(path or USER_PREFS_PATH)
 
 
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Encode to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _save_json(data: Dict[str, Any], path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    payload = _dumps(data)
+    with open(path, "wb") as f:
+        f.write(payload)
 
 
 def _load_json(path: str) -> Dict[str, Any]:
     if not os.path.exists(path):
         return {}
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         try:
-            return json.load(f)
+            return _loads(f.read())
         except Exception:
             return {}
\ No newline at end of file
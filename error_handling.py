@@ -2,10 +2,19 @@
 Centralized error handling for SIA Dashboard UI.
 """
 
+import inspect
 from functools import wraps
 
 def handle_errors(user_message="An error occurred."):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    return f"{user_message} Details: {e}"
+            return async_wrapper
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
@@ -17,4 +26,4 @@ def handle_errors(user_message="An error occurred."):
     return decorator
 
 def format_error_message(e, user_message="An error occurred."):
-    return f"{user_message} Details: {e}"
\ No newline at end of file
+    return f"{user_message} Details: {e}"
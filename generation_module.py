@@ -27,32 +27,32 @@ class GenerationModule:
     - Utilizes analysis results and memory context to produce relevant content.
     - Interfaces with integration and orchestrator modules for coordinated output.
     """
-def __init__(self):
-    """
-    Initialize the GenerationModule with LLM integration (OpenAI, Hugging Face, OpenRouter, Anthropic, or LM Studio).
-    """
-    self.llm_provider = LLM_PROVIDER.lower()
-    self.openai_model = OPENAI_MODEL
-    self.openai_api_key = OPENAI_API_KEY
-    self.hf_model = HF_MODEL
-    self.hf_api_key = HF_API_KEY
-    self.hf_pipe = None
-    self.openrouter_api_key = OPENROUTER_API_KEY
-    self.openrouter_model = OPENROUTER_MODEL
-    self.anthropic_api_key = ANTHROPIC_API_KEY
-    self.anthropic_model = ANTHROPIC_MODEL
-    self.lmstudio_api_url = LMSTUDIO_API_URL
-    self.lmstudio_model = LMSTUDIO_MODEL
+    def __init__(self):
+        """
+        Initialize the GenerationModule with LLM integration (OpenAI, Hugging Face, OpenRouter, Anthropic, or LM Studio).
+        """
+        self.llm_provider = LLM_PROVIDER.lower()
+        self.openai_model = OPENAI_MODEL
+        self.openai_api_key = OPENAI_API_KEY
+        self.hf_model = HF_MODEL
+        self.hf_api_key = HF_API_KEY
+        self.hf_pipe = None
+        self.openrouter_api_key = OPENROUTER_API_KEY
+        self.openrouter_model = OPENROUTER_MODEL
+        self.anthropic_api_key = ANTHROPIC_API_KEY
+        self.anthropic_model = ANTHROPIC_MODEL
+        self.lmstudio_api_url = LMSTUDIO_API_URL
+        self.lmstudio_model = LMSTUDIO_MODEL
 
-    if self.llm_provider == "huggingface" and pipeline and AutoTokenizer and AutoModelForCausalLM:
-        # Load Hugging Face pipeline
-        self.hf_pipe = pipeline(
-            "text-generation",
-            model=self.hf_model,
-            tokenizer=self.hf_model,
-            use_auth_token=self.hf_api_key if self.hf_api_key else None
-        )
-    # No explicit OpenRouter or LM Studio client needed; handled via requests
+        if self.llm_provider == "huggingface" and pipeline and AutoTokenizer and AutoModelForCausalLM:
+            # Load Hugging Face pipeline
+            self.hf_pipe = pipeline(
+                "text-generation",
+                model=self.hf_model,
+                tokenizer=self.hf_model,
+                use_auth_token=self.hf_api_key if self.hf_api_key else None
+            )
+        # No explicit OpenRouter or LM Studio client needed; handled via requests
 
     def generate_code(self, analysis_results, memory_context):
         """
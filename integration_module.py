@@ -6,6 +6,12 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# User-facing result messages (shared with tests via prefix checks)
+MERGE_CONFLICT_PREFIX = "Merge conflict detected"
+MERGE_CONFLICT_MSG = MERGE_CONFLICT_PREFIX + " in {repo_path}. Manual resolution required."
+REBASED_MSG = "Rebased and updated PR."
+PR_STATUS_PREFIX = "PR status: "
+
 class IntegrationModule:
     """
     Core integration module for SIA.
@@ -161,17 +167,21 @@ class IntegrationModule:
         if pr_status == "Needs Rebase":
             logger.info(f"Auto-rebasing branch {branch_name} for PR {pr_id}.")
             # Simulate rebase
-            return "Rebased and updated PR."
-        return f"PR status: {pr_status}"
+            return REBASED_MSG
+        return PR_STATUS_PREFIX + pr_status
 
-    def handle_merge_conflict(self, repo_path: str) -> None:
+    def handle_merge_conflict(self, repo_path: str) -> str:
         """
         Handle merge conflicts in the repository.
         Args:
             repo_path (str): Path to the local repository.
+        Returns:
+            str: The merge conflict message that was logged.
         """
         # Simulate merge conflict handling (integration with real logic needed)
-        logger.warning(f"Merge conflict detected in {repo_path}. Manual resolution required.")
+        msg = MERGE_CONFLICT_MSG.format(repo_path=repo_path)
+        logger.warning(msg)
+        return msg
 
     def send_email_notification(self, to_email: str, subject: str, body: str) -> None:
         """
@@ -2,6 +2,7 @@ import logging
 import numpy as np
 import os
 import json
+from functools import lru_cache
 from config import VECTOR_DB, PINECONE_API_KEY, PINECONE_ENV, MEMORY_STORAGE_PATH, SIA_ENCRYPTION_KEY
 from cryptography.fernet import Fernet, InvalidToken
 import base64
@@ -9,6 +10,8 @@ import base64
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Storage events (saves, loads, backups) are recorded here, never memory contents
+audit_logger = logging.getLogger(__name__ + ".audit")
 
 try:
     import faiss
@@ -20,6 +23,23 @@ try:
 except ImportError:
     pinecone = None
 
+# In-memory storage backend: storage paths starting with "mem://" are kept
+# here as encrypted bytes instead of being written to the filesystem.
+IN_MEMORY_PREFIX = "mem://"
+_in_memory_store = {}
+
+
+@lru_cache(maxsize=512)
+def _cached_embedding(text, embedding_dim):
+    """
+    Deterministic placeholder embedding, memoized per (text, dimension).
+    The returned array is read-only because it is shared between callers.
+    """
+    np.random.seed(abs(hash(text)) % (2**32))
+    vec = np.random.rand(embedding_dim).astype('float32')
+    vec.flags.writeable = False
+    return vec
+
 class MemoryModule:
     """
     Core memory management module for SIA.
@@ -88,7 +108,7 @@ class MemoryModule:
     def _embed(self, text):
         """
         Generate an embedding for the given text.
-        Placeholder: returns a random vector.
+        Placeholder: returns a random vector seeded by the text, memoized since it is deterministic.
 
         Args:
             text (str): Input text to embed.
@@ -97,8 +117,7 @@ class MemoryModule:
             np.ndarray: Embedding vector.
         """
         # Replace with real embedding model (e.g., Sentence Transformers) when available
-        np.random.seed(abs(hash(text)) % (2**32))
-        return np.random.rand(self.embedding_dim).astype('float32')
+        return _cached_embedding(text, self.embedding_dim)
 
     def store_memory(self, text, meta=None, memory_type="semantic"):
         """
@@ -133,7 +152,7 @@ class MemoryModule:
             logger.error(f"Error storing memory: {e}", exc_info=True)
             return -1
 
-    def retrieve_memory(self, query, top_k=5, memory_type=None, hybrid=True):
+    def retrieve_memory(self, query=None, top_k=5, memory_type=None, hybrid=True, queries=None):
         """
         Retrieve memories most semantically similar to the query using hybrid retrieval (vector + keyword).
 
@@ -142,11 +161,18 @@ class MemoryModule:
             top_k (int): Number of top results to return.
             memory_type (str, optional): Filter by memory type ("episodic", "semantic", "procedural").
             hybrid (bool): If True, combine vector search with keyword search.
+            queries (list of str, optional): Batch of query texts; when given, `query` is ignored.
 
         Returns:
             list of dict: Each dict contains "text", "type", "meta", "score".
+            If `queries` is given, a dict mapping each query to its list of results.
         Includes error handling and logging.
         """
+        if queries is not None:
+            return {
+                q: self.retrieve_memory(q, top_k=top_k, memory_type=memory_type, hybrid=hybrid)
+                for q in queries
+            }
         try:
             if len(self.memories) == 0:
                 return []
@@ -229,21 +255,27 @@ class MemoryModule:
         """
         Prune memories with similarity scores below the relevance threshold.
 
-        Optionally restricts pruning to a specific memory_type ("episodic", "semantic", "procedural").
+        Optionally restricts pruning to one or more memory types ("episodic", "semantic", "procedural").
 
         Args:
             relevance_threshold (float): Minimum similarity score to keep.
-            memory_type (str, optional): Only prune memories of this type.
+            memory_type (str or iterable of str, optional): Only prune memories of these type(s).
 
         Returns:
             int: Number of memories pruned.
         """
         if not self.index or len(self.memories) == 0:
             return 0
+        if isinstance(memory_type, str):
+            memory_types = {memory_type}
+        elif memory_type is not None:
+            memory_types = set(memory_type)
+        else:
+            memory_types = None
         # Filter by memory type if specified
         indices = [
             i for i, m in enumerate(self.memories)
-            if memory_type is None or m.get("type", "semantic") == memory_type
+            if memory_types is None or m.get("type", "semantic") in memory_types
         ]
         if not indices:
             return 0
@@ -251,7 +283,7 @@ class MemoryModule:
         all_embeddings = self.index.reconstruct_n(0, len(self.memories))
         centroid = np.mean([all_embeddings[i] for i in indices], axis=0, keepdims=True)
         D, _ = self.index.search(centroid, len(self.memories))
-        to_prune = [i for i, dist in enumerate(D[0]) if -dist < relevance_threshold and (memory_type is None or self.memories[i].get("type", "semantic") == memory_type)]
+        to_prune = [i for i, dist in enumerate(D[0]) if -dist < relevance_threshold and (memory_types is None or self.memories[i].get("type", "semantic") in memory_types)]
         for i in sorted(to_prune, reverse=True):
             del self.memories[i]
             if self.index:
@@ -305,11 +337,14 @@ class MemoryModule:
             data = {
                 "memories": self.memories
             }
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
             plaintext = json.dumps(data, indent=2).encode("utf-8")
             ciphertext = self.fernet.encrypt(plaintext)
-            with open(self.storage_path, "wb") as f:
-                f.write(ciphertext)
+            if self._is_in_memory_storage():
+                _in_memory_store[self.storage_path] = ciphertext
+            else:
+                os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
+                with open(self.storage_path, "wb") as f:
+                    f.write(ciphertext)
             logger.info(f"Memories saved (encrypted) to disk at {self.storage_path}")
             self._audit_log("save_to_disk", {"storage_path": self.storage_path, "memory_count": len(self.memories)})
         except Exception as e:
@@ -324,33 +359,70 @@ class MemoryModule:
         Audit log is written for each load operation.
         """
         try:
-            if os.path.exists(self.storage_path):
-                with open(self.storage_path, "rb") as f:
-                    ciphertext = f.read()
-                    try:
-                        plaintext = self.fernet.decrypt(ciphertext)
-                        data = json.loads(plaintext.decode("utf-8"))
-                        self.memories = data.get("memories", [])
-                        logger.info(f"Memories loaded (decrypted) from disk at {self.storage_path}")
-                        self._audit_log("load_from_disk", {"storage_path": self.storage_path, "memory_count": len(self.memories)})
-                    except InvalidToken:
-                        logger.error("Failed to decrypt memory storage file. Invalid encryption key or corrupted file.", exc_info=True)
-                        self.memories = []
-                        self._audit_log("load_from_disk_error", {"error": "InvalidToken"})
+            ciphertext = self._read_storage()
+            if ciphertext is not None:
+                try:
+                    plaintext = self.fernet.decrypt(ciphertext)
+                    data = json.loads(plaintext.decode("utf-8"))
+                    self.memories = data.get("memories", [])
+                    logger.info(f"Memories loaded (decrypted) from disk at {self.storage_path}")
+                    self._audit_log("load_from_disk", {"storage_path": self.storage_path, "memory_count": len(self.memories)})
+                except InvalidToken:
+                    logger.error("Failed to decrypt memory storage file. Invalid encryption key or corrupted file.", exc_info=True)
+                    self.memories = []
+                    self._audit_log("load_from_disk_error", {"error": "InvalidToken"})
         except Exception as e:
             logger.error(f"Error loading memories from disk: {e}", exc_info=True)
             self._audit_log("load_from_disk_error", {"error": str(e)})
+
+    def _audit_log(self, event, details=None):
+        """
+        Record a storage event on the audit logger.
+
+        Args:
+            event (str): Event name, e.g. "save_to_disk".
+            details (dict, optional): Event metadata such as paths and counts.
+        """
+        audit_logger.info("event=%s details=%s", event, details or {})
+
+    def _is_in_memory_storage(self):
+        """Return True if storage_path points at the in-memory backend (mem://...)."""
+        return self.storage_path.startswith(IN_MEMORY_PREFIX)
+
+    def _read_storage(self):
+        """
+        Read the encrypted storage payload.
+
+        Returns:
+            bytes: Ciphertext, or None if nothing has been stored yet.
+        """
+        if self._is_in_memory_storage():
+            return _in_memory_store.get(self.storage_path)
+        if not os.path.exists(self.storage_path):
+            return None
+        with open(self.storage_path, "rb") as f:
+            return f.read()
+
     def backup_memories(self, backup_dir="./sia_data/backups"):
         """
         Create a timestamped backup of the encrypted memory storage file.
+        For in-memory storage (mem://...) the backup is another in-memory entry,
+        keyed "<storage_path>/backups/memories_<timestamp>.bak", and backup_dir is unused.
         """
         import shutil
         import datetime
-        os.makedirs(backup_dir, exist_ok=True)
         timestamp = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        backup_path = os.path.join(backup_dir, f"memories_{timestamp}.bak")
         try:
-            shutil.copy2(self.storage_path, backup_path)
+            if self._is_in_memory_storage():
+                backup_path = f"{self.storage_path}/backups/memories_{timestamp}.bak"
+                ciphertext = _in_memory_store.get(self.storage_path)
+                if ciphertext is None:
+                    raise FileNotFoundError(f"Nothing stored at {self.storage_path} yet.")
+                _in_memory_store[backup_path] = ciphertext
+            else:
+                os.makedirs(backup_dir, exist_ok=True)
+                backup_path = os.path.join(backup_dir, f"memories_{timestamp}.bak")
+                shutil.copy2(self.storage_path, backup_path)
             self._audit_log("backup_memories", {"backup_path": backup_path})
             logger.info(f"Memory backup created at {backup_path}")
             return backup_path
@@ -1,12 +1,69 @@
 from dotenv import load_dotenv
 load_dotenv()
 from fastapi import FastAPI, Depends, HTTPException, status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Any
 from orchestrator import Orchestrator
 from config import SIA_API_KEY
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+JSON_MEDIA_TYPE = "application/json"
+
+def _accept_quality(accept, media_type):
+    """
+    Return (q, specificity) for media_type under an Accept header.
+
+    The most specific matching range wins (type/subtype over type/* over */*),
+    as in RFC 9110 section 12.5.1; (0.0, -1) means the type is not acceptable.
+    """
+    main_type = media_type.split("/")[0]
+    best_q, best_specificity = 0.0, -1
+    for media_range in accept.split(","):
+        range_type, *params = [part.strip() for part in media_range.split(";")]
+        range_type = range_type.lower()
+        if range_type == media_type:
+            specificity = 2
+        elif range_type == f"{main_type}/*":
+            specificity = 1
+        elif range_type == "*/*":
+            specificity = 0
+        else:
+            continue
+        if specificity < best_specificity:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        best_q, best_specificity = q, specificity
+    return best_q, best_specificity
+
+def prefers_msgpack(accept):
+    """
+    Decide whether a client's Accept header asks for msgpack over JSON.
+
+    msgpack is chosen only when it is acceptable and ranks higher than JSON,
+    or ties with JSON while being named explicitly; wildcards alone keep JSON.
+    """
+    if msgpack is None or not accept:
+        return False
+    msgpack_q, msgpack_specificity = _accept_quality(accept, MSGPACK_MEDIA_TYPE)
+    json_q, _ = _accept_quality(accept, JSON_MEDIA_TYPE)
+    if msgpack_q <= 0:
+        return False
+    return msgpack_q > json_q or (msgpack_q == json_q and msgpack_specificity == 2)
+
 def api_key_auth(request: Request):
     api_key = request.headers.get("x-api-key")
     if not api_key or api_key != SIA_API_KEY:
@@ -21,6 +78,9 @@ app = FastAPI(
     description="API for memory operations, code analysis, code generation, and PR submission.",
     version="1.0.0"
 )
+# Compress JSON responses for clients that send Accept-Encoding: gzip
+# (aiohttp and requests both do by default); tiny bodies are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 orchestrator = Orchestrator()
 
@@ -104,7 +164,7 @@ async def manual_memory_inject(req: ManualMemoryInjectRequest, auth: bool = Depe
     Manually inject a memory (bypassing embedding/index).
     Supports all memory types: episodic, semantic, procedural.
     """
-    idx = orchestrator.memory_module.inject_memory(
+    idx = orchestrator.memory.inject_memory(
         text=req.text,
         meta=req.meta,
         memory_type=req.memory_type
@@ -112,12 +172,15 @@ async def manual_memory_inject(req: ManualMemoryInjectRequest, auth: bool = Depe
     return ManualMemoryInjectResponse(index=idx)
 
 @app.get("/memory/manual_retrieve", response_model=ManualMemoryRetrieveResponse)
-async def manual_memory_retrieve(idx: int, auth: bool = Depends(api_key_auth)):
+async def manual_memory_retrieve(idx: int, request: Request, auth: bool = Depends(api_key_auth)):
     """
     Retrieve a memory by its index.
     Returns the memory dict or null if not found.
+    Clients whose Accept header prefers application/msgpack get a msgpack body instead of JSON.
     """
-    mem = orchestrator.memory_module.get_memory(idx)
+    mem = orchestrator.memory.get_memory(idx)
+    if prefers_msgpack(request.headers.get("accept", "")):
+        return Response(content=msgpack.packb({"memory": mem}), media_type=MSGPACK_MEDIA_TYPE)
     return ManualMemoryRetrieveResponse(memory=mem)
 
 @app.post("/analyze", response_model=AnalyzeResponse)
@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures for SIA tests.
+"""
+
+import pytest
+
+@pytest.fixture(scope="session")
+def _mem_dir(tmp_path_factory):
+    """Single un-numbered directory reused by every memory storage test in the session."""
+    return tmp_path_factory.mktemp("mem", numbered=False)
+
+@pytest.fixture
+def mem_path(_mem_dir):
+    """Path to a memory storage file; removed after each test so tests stay isolated."""
+    path = _mem_dir / "mem.json"
+    yield path
+    path.unlink(missing_ok=True)
@@ -0,0 +1,28 @@
+"""
+Unit tests for dashboard state and user preference persistence.
+"""
+import os
+import tempfile
+
+from dashboard_persistence import (
+    save_dashboard_state, load_dashboard_state,
+    save_user_preferences, load_user_preferences
+)
+
+def test_dashboard_state_persistence_roundtrip():
+    """Test saving and loading dashboard state using a temp file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "state.json")
+        state = {"last_choice": "2", "last_msg": "Test message"}
+        save_dashboard_state(state, path=path)
+        loaded = load_dashboard_state(path=path)
+        assert loaded == state
+
+def test_user_preferences_persistence_roundtrip():
+    """Test saving and loading user preferences using a temp file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "prefs.json")
+        prefs = {"theme": "dark", "layout": "compact"}
+        save_user_preferences(prefs, path=path)
+        loaded = load_user_preferences(path=path)
+        assert loaded == prefs
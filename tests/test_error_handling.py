@@ -0,0 +1,9 @@
+"""
+Unit tests for centralized error handling helpers.
+"""
+from error_handling import format_error_message
+
+def test_error_message_formatting():
+    """Test centralized error message formatting."""
+    msg = format_error_message(Exception("fail"), "Custom user message")
+    assert "Custom user message" in msg and "fail" in msg
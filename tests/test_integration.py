@@ -17,18 +17,61 @@ def test_self_analysis_cycle():
     report = o.run_self_analysis_cycle()
     assert report is not None
 
+def _stub_workflow_inputs(monkeypatch, o):
+    """Stub the memory/analysis/generation steps that feed the PR workflow."""
+    monkeypatch.setattr(o, "retrieve_memory", lambda: [])
+    monkeypatch.setattr(o, "analyze", lambda memories: {})
+    monkeypatch.setattr(o.generation, "generate_code", lambda analysis, context: "print('generated')\n")
+
 def test_code_generation_and_pr(monkeypatch):
-    """Integration test: code generation and PR workflow."""
+    """Integration test: code generation and PR workflow with git/PR calls mocked out."""
+    o = Orchestrator()
+    _stub_workflow_inputs(monkeypatch, o)
+    monkeypatch.setattr(o.integration, "clone_repo", lambda repo_url, to_path: object())
+    monkeypatch.setattr(o.integration, "get_current_version", lambda repo_path: "abc123")
+    monkeypatch.setattr(o.integration, "create_branch", lambda repo_path, branch: True)
+    monkeypatch.setattr(o.integration, "commit_changes", lambda repo_path, message: True)
+    monkeypatch.setattr(o.integration, "push_changes", lambda repo_path, branch: True)
+    monkeypatch.setattr(o.integration, "create_pull_request", lambda repo_url, branch, title, desc: 4242)
+    saved = []
+    monkeypatch.setattr(o, "save_pr_result_to_disk", lambda pr_result: saved.append(pr_result))
+    result = o.automate_code_and_pr_workflow(
+        repo_url="https://example.com/repo.git",
+        file_path="dummy.py",
+        branch_name="test-branch",
+        pr_title="Test PR",
+        pr_description="Integration test PR"
+    )
+    assert "pending human approval" in result
+    assert saved[-1]["pr_id"] == 4242
+    assert saved[-1]["rollback_commit"] == "abc123"
+    assert saved[-1]["approved"] is False
+
+@pytest.mark.network
+def test_code_generation_and_pr_network(monkeypatch):
+    """Contract test: PR workflow against a real remote (deselected by default)."""
     o = Orchestrator()
-    # Mock external dependencies if needed
-    try:
-        result = o.automate_code_and_pr_workflow(
-            repo_url="https://example.com/repo.git",
-            file_path="dummy.py",
-            branch_name="test-branch",
-            pr_title="Test PR",
-            pr_description="Integration test PR"
+    _stub_workflow_inputs(monkeypatch, o)
+    saved = []
+    monkeypatch.setattr(o, "save_pr_result_to_disk", lambda pr_result: saved.append(pr_result))
+    result = o.automate_code_and_pr_workflow(
+        repo_url="https://example.com/repo.git",
+        file_path="dummy.py",
+        branch_name="test-branch",
+        pr_title="Test PR",
+        pr_description="Integration test PR"
+    )
+    # Every outcome, success or a failed step, is persisted and reported back.
+    assert len(saved) == 1
+    if saved[0]["status"] == "PR pending approval":
+        assert "pending human approval" in result
+        assert saved[0]["approved"] is False
+        assert saved[0]["rollback_commit"]
+    else:
+        assert result == saved[0]["status"]
+        assert result in (
+            "Failed to clone repository.",
+            "Failed to create branch.",
+            "Failed to commit changes.",
+            "Failed to push changes.",
         )
-        assert result is None or result is not False
-    except Exception:
-        pytest.skip("PR workflow may require external services")
\ No newline at end of file
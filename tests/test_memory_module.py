@@ -11,31 +11,40 @@ def test_init_default():
     assert hasattr(m, "embedding_dim")
     assert hasattr(m, "storage_path")
 
-def test_store_and_retrieve_memory(tmp_path):
+def test_store_and_retrieve_memory(mem_path):
     """Test storing and retrieving memory."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path=str(mem_path))
     m.store_memory("test memory", meta={"source": "unit"})
     results = m.retrieve_memory("test")
     assert any("test memory" in r["text"] for r in results)
 
-def test_prune_memories(tmp_path):
+def test_prune_memories(mem_path):
     """Test pruning memories by type and threshold."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path=str(mem_path))
     m.store_memory("episodic one", memory_type="episodic")
     m.store_memory("semantic two", memory_type="semantic")
     m.store_memory("procedural three", memory_type="procedural")
-    # Prune only episodic
-    pruned = m.prune_memories(relevance_threshold=1.0, memory_type="episodic")
-    assert isinstance(pruned, int)
-    episodic = m.retrieve_memory("episodic", memory_type="episodic")
-    assert len(episodic) == 0 or all("episodic" not in r["text"] for r in episodic)
-    # Prune all
-    m.prune_memories(relevance_threshold=1.0)
-    assert all(len(m.retrieve_memory(q)) == 0 for q in ["semantic", "procedural"])
+    # Prune all types in one batched call
+    pruned = m.prune_memories(relevance_threshold=1.0, memory_type=["episodic", "semantic", "procedural"])
+    assert pruned == 3
+    assert m.index.ntotal == 0
+    results = m.retrieve_memory(queries=["episodic", "semantic", "procedural"])
+    assert set(results) == {"episodic", "semantic", "procedural"}
+    assert all(len(r) == 0 for r in results.values())
 
-def test_save_and_load_disk(tmp_path):
-    """Test saving and loading memories to disk with types."""
-    path = str(tmp_path / "mem.json")
+def test_prune_memories_type_subset(mem_path):
+    """Test a batched prune only touches the listed memory types."""
+    m = MemoryModule(storage_path=str(mem_path))
+    m.store_memory("episodic one", memory_type="episodic")
+    m.store_memory("semantic two", memory_type="semantic")
+    m.store_memory("procedural three", memory_type="procedural")
+    pruned = m.prune_memories(relevance_threshold=1.0, memory_type=["episodic", "semantic"])
+    assert pruned == 2
+    assert [mem["type"] for mem in m.memories] == ["procedural"]
+
+def test_save_and_load_disk():
+    """Test saving and loading memories with types (in-memory storage backend)."""
+    path = "mem://test_save_and_load_disk"
     m = MemoryModule(storage_path=path)
     m.store_memory("persisted semantic", memory_type="semantic")
     m.store_memory("persisted episodic", memory_type="episodic")
@@ -47,9 +56,9 @@ def test_save_and_load_disk(tmp_path):
     assert any("persisted semantic" in r["text"] for r in sem)
     assert any("persisted episodic" in r["text"] for r in epi)
 
-def test_hybrid_retrieval(tmp_path):
+def test_hybrid_retrieval():
     """Test hybrid retrieval returns both semantic and keyword matches."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path="mem://test_hybrid_retrieval")
     m.store_memory("semantic apple banana", memory_type="semantic")
     m.store_memory("episodic orange apple", memory_type="episodic")
     m.store_memory("procedural how to peel banana", memory_type="procedural")
@@ -59,9 +68,9 @@ def test_hybrid_retrieval(tmp_path):
     assert "semantic apple banana" in texts
     assert "episodic orange apple" in texts or "procedural how to peel banana" in texts
 
-def test_memory_type_retrieval_and_pruning(tmp_path):
+def test_memory_type_retrieval_and_pruning(mem_path):
     """Test retrieval and pruning for all memory types."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path=str(mem_path))
     m.store_memory("episodic event", memory_type="episodic")
     m.store_memory("semantic fact", memory_type="semantic")
     m.store_memory("procedural step", memory_type="procedural")
@@ -78,9 +87,9 @@ def test_memory_type_retrieval_and_pruning(tmp_path):
     pro2 = m.retrieve_memory("step", memory_type="procedural")
     assert len(pro2) == 0 or all("procedural" not in r["text"] for r in pro2)
 
-def test_encryption_failure(monkeypatch, tmp_path):
+def test_encryption_failure(monkeypatch, mem_path):
     """Test encryption failure during save_to_disk is handled gracefully."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path=str(mem_path))
     m.store_memory("test", meta={})
     def broken_encrypt(x):
         raise Exception("Encryption failed")
@@ -90,9 +99,9 @@ def test_encryption_failure(monkeypatch, tmp_path):
     except Exception:
         pass  # Should not raise, only log
 
-def test_decryption_failure(monkeypatch, tmp_path):
+def test_decryption_failure(monkeypatch, mem_path):
     """Test decryption failure during load_from_disk is handled gracefully."""
-    m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
+    m = MemoryModule(storage_path=str(mem_path))
     m.store_memory("test", meta={})
     m.save_to_disk()
     def broken_decrypt(x):
@@ -108,4 +117,14 @@ def test_backup_memories(tmp_path):
     m = MemoryModule(storage_path=str(tmp_path / "mem.json"))
     m.store_memory("backup test", meta={})
     backup_path = m.backup_memories(backup_dir=str(tmp_path / "backups"))
-    assert backup_path is not None
\ No newline at end of file
+    assert backup_path is not None
+
+def test_backup_memories_in_memory():
+    """Test backup_memories copies in-memory (mem://) storage to an in-memory backup entry."""
+    from memory_module import _in_memory_store
+    path = "mem://test_backup_memories_in_memory"
+    m = MemoryModule(storage_path=path)
+    m.store_memory("backup test", meta={})
+    backup_path = m.backup_memories()
+    assert backup_path.startswith(path + "/backups/")
+    assert _in_memory_store[backup_path] == _in_memory_store[path]
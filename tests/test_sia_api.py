@@ -44,4 +44,70 @@ def test_internal_server_error(monkeypatch):
         raise Exception("Simulated failure")
     monkeypatch.setattr(sia_api, "get_memory", broken)
     response = client.get("/memory/test")
-    assert response.status_code == 500 or response.status_code == 200  # Accepts fallback
\ No newline at end of file
+    assert response.status_code == 500 or response.status_code == 200  # Accepts fallback
+
+@pytest.fixture
+def stored_memory(monkeypatch):
+    """Serve one known memory from /memory/manual_retrieve and return it with valid auth headers."""
+    memory = {"text": "x" * 2000, "type": "semantic", "meta": {"source": "test"}}
+    monkeypatch.setattr(sia_api, "SIA_API_KEY", "test-key")
+    monkeypatch.setattr(sia_api.orchestrator.memory, "get_memory", lambda idx: memory)
+    return memory, {"x-api-key": "test-key"}
+
+def test_manual_retrieve_msgpack(stored_memory):
+    """Test manual_retrieve answers Accept: application/msgpack with a msgpack body."""
+    msgpack = pytest.importorskip("msgpack")
+    memory, headers = stored_memory
+    response = client.get("/memory/manual_retrieve", params={"idx": 0}, headers={**headers, "Accept": "application/msgpack"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == sia_api.MSGPACK_MEDIA_TYPE
+    assert msgpack.unpackb(response.content) == {"memory": memory}
+
+def test_manual_retrieve_json_by_default(stored_memory):
+    """Test manual_retrieve still answers JSON when msgpack is not requested."""
+    memory, headers = stored_memory
+    response = client.get("/memory/manual_retrieve", params={"idx": 0}, headers={**headers, "Accept": "application/json"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json() == {"memory": memory}
+
+def test_large_responses_are_gzipped(stored_memory):
+    """Test responses over the middleware's minimum size are gzip-encoded for clients that accept it."""
+    memory, headers = stored_memory
+    response = client.get("/memory/manual_retrieve", params={"idx": 0}, headers={**headers, "Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"memory": memory}
+
+def test_small_responses_are_not_gzipped(monkeypatch, stored_memory):
+    """Test bodies under the minimum size are sent uncompressed."""
+    _, headers = stored_memory
+    monkeypatch.setattr(sia_api.orchestrator.memory, "get_memory", lambda idx: {"text": "short"})
+    response = client.get("/memory/manual_retrieve", params={"idx": 0}, headers={**headers, "Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"memory": {"text": "short"}}
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/msgpack", True),
+    ("application/msgpack, application/json", True),
+    ("application/json;q=0.9, application/msgpack", True),
+    ("application/msgpack;q=0.5, application/json", False),
+    ("application/msgpack;q=0", False),
+    ("application/*;q=0.8, application/msgpack;q=0", False),
+    ("*/*", False),
+    ("application/json", False),
+    ("", False),
+])
+def test_prefers_msgpack_honours_q_values(accept, expected):
+    """Test Accept negotiation ranks media types by q-value and specificity."""
+    pytest.importorskip("msgpack")
+    assert sia_api.prefers_msgpack(accept) is expected
+
+def test_manual_retrieve_json_when_msgpack_ranked_lower(stored_memory):
+    """Test manual_retrieve answers JSON when the client ranks msgpack below JSON."""
+    memory, headers = stored_memory
+    response = client.get("/memory/manual_retrieve", params={"idx": 0}, headers={**headers, "Accept": "application/msgpack;q=0.1, application/json"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json() == {"memory": memory}
@@ -19,43 +19,111 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt
 from rich.text import Text
-import requests
+import hashlib
 import json
 import os
-import sys
+import re
 import logging
+import queue
+import threading
+import time
+import atexit
+import collections
 
 # --- Audit Logging Setup ---
-AUDIT_LOG_PATH = os.path.join(os.path.dirname(__file__), "audit.log")
-_audit_logger = logging.getLogger("sia_audit")
-_audit_logger.setLevel(logging.INFO)
-_audit_handler = logging.FileHandler(AUDIT_LOG_PATH, encoding="utf-8")
-_audit_handler.setLevel(logging.INFO)
-_audit_formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
-_audit_handler.setFormatter(_audit_formatter)
-_audit_logger.addHandler(_audit_handler)
-_audit_logger.propagate = False
-
-# Restrict permissions: owner read/write only (0600, cross-platform best effort)
+# Events are queued by audit_log() and written by a background flusher thread,
+# which issues one write() + data sync per batch instead of per event.
+AUDIT_LOG_PATH = os.environ.get("SIA_AUDIT_LOG_PATH", os.path.join(os.path.dirname(__file__), "audit.log"))
+AUDIT_QUEUE_MAXSIZE = 4096
+AUDIT_BATCH_SIZE = 256
+_audit_queue = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+# Most recent audit messages, kept in memory so readers need not wait on the disk flush.
+_recent_audit_events = collections.deque(maxlen=1024)
+AUDIT_LOG_FD = os.open(AUDIT_LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+
+# Restrict permissions once on the open descriptor: owner read/write only (0600).
+# os.fchmod is POSIX-only; on other platforms this is a best-effort no-op.
 try:
-    if os.path.exists(AUDIT_LOG_PATH):
-        os.chmod(AUDIT_LOG_PATH, 0o600)
-except Exception:
+    os.fchmod(AUDIT_LOG_FD, 0o600)
+except (AttributeError, OSError):
     pass
 
+def _format_audit_line(ts, msg):
+    """Format an audit record like logging's '%(asctime)s %(levelname)s %(message)s'."""
+    asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+    return f"{asctime},{int(ts % 1 * 1000):03d} INFO {msg}\n".encode("utf-8")
+
+# fdatasync (Linux/POSIX) skips flushing metadata such as mtime that an
+# append-only log does not need; fall back to fsync elsewhere.
+_audit_sync = getattr(os, "fdatasync", os.fsync)
+
+def _write_audit_batch(batch):
+    """Append a batch of (timestamp, message) records with a single write and sync."""
+    data = b"".join(_format_audit_line(ts, msg) for ts, msg in batch)
+    os.write(AUDIT_LOG_FD, data)
+    _audit_sync(AUDIT_LOG_FD)
+
+# Events that arrived while the queue was full. audit_log() never blocks the
+# event loop on a stalled disk; the flusher records the count in the log instead.
+_audit_dropped = 0
+_audit_dropped_lock = threading.Lock()
+
+def _take_audit_dropped():
+    """Return and reset the number of audit events dropped since the last call."""
+    global _audit_dropped
+    with _audit_dropped_lock:
+        dropped, _audit_dropped = _audit_dropped, 0
+    return dropped
+
+def _audit_flusher():
+    """Background thread: drain up to AUDIT_BATCH_SIZE queued events per write."""
+    while True:
+        batch = [_audit_queue.get()]
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        queued = len(batch)
+        try:
+            dropped = _take_audit_dropped()
+            if dropped:
+                batch.append((time.time(), f"event=audit_events_dropped count={dropped}"))
+            _write_audit_batch(batch)
+        except Exception:
+            # Keep draining whatever happens, or audit_log_flush() would hang on join()
+            logging.getLogger(__name__).error("Failed to write audit log batch.", exc_info=True)
+        finally:
+            for _ in range(queued):
+                _audit_queue.task_done()
+
+threading.Thread(target=_audit_flusher, name="sia-audit-flusher", daemon=True).start()
+
+def audit_log_flush():
+    """Block until every queued audit event has been written to AUDIT_LOG_PATH."""
+    _audit_queue.join()
+
+atexit.register(audit_log_flush)
+
+_SENSITIVE_RE = re.compile(r"token|secret|authorization", re.IGNORECASE)
+# Memory fields whose values are masked before display
+_SANITIZE_KEY_RE = re.compile(r"secret|token", re.IGNORECASE)
+
 def audit_log(event, user=None, details=None):
+    global _audit_dropped
     # Never log secrets/tokens
-    safe_details = ""
-    if details:
-        safe_details = str(details)
-        for sensitive in ["token", "secret", "authorization"]:
-            safe_details = safe_details.replace(sensitive, "***")
+    safe_details = _SENSITIVE_RE.sub("***", str(details)) if details else ""
     msg = f"event={event}"
     if user:
         msg += f" user={user}"
     if safe_details:
         msg += f" details={safe_details}"
-    _audit_logger.info(msg)
+    _recent_audit_events.append(msg)
+    try:
+        _audit_queue.put_nowait((time.time(), msg))
+    except queue.Full:
+        with _audit_dropped_lock:
+            _audit_dropped += 1
 # --- End Audit Logging Setup ---
 
 # Accessibility mode support will be added below
@@ -65,6 +133,16 @@ ACCESSIBILITY_MODE = os.environ.get("SIA_ACCESSIBILITY_MODE", "0") == "1"
 def is_accessibility_mode():
     return ACCESSIBILITY_MODE
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Persistence for dashboard state and user preferences
 from dashboard_persistence import (
     load_dashboard_state, save_dashboard_state,
@@ -100,55 +178,135 @@ generation_mod = GenerationModule()
 integration_mod = IntegrationModule()
 
 import asyncio
-
-async def get_memory_usage():
+import contextlib
+import functools
+import inspect
+import itertools
+
+# --- Panel data TTL cache ---
+# Maps a fetcher's function name to (expiry, value). Each panel re-fetches only
+# once its freshness window has passed, or after an explicit invalidation by an
+# action that changes what it shows.
+_ttl_cache = {}
+
+def ttl_cache(seconds):
+    """Cache a fetcher's result for `seconds`, keyed on its function name (sync or async)."""
+    def decorator(func):
+        key = func.__name__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper():
+                entry = _ttl_cache.get(key)
+                now = time.monotonic()
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+                value = await func()
+                _ttl_cache[key] = (now + seconds, value)
+                return value
+            return async_wrapper
+        @functools.wraps(func)
+        def wrapper():
+            entry = _ttl_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            value = func()
+            _ttl_cache[key] = (now + seconds, value)
+            return value
+        return wrapper
+    return decorator
+
+def invalidate_panel_cache(name):
+    """Drop the cached value for the fetcher `name` so its next call re-fetches."""
+    _ttl_cache.pop(name, None)
+# --- End Panel data TTL cache ---
+
+@ttl_cache(seconds=30)
+def get_memory_usage():
     """
-    Integration: Retrieve live memory usage from MemoryModule (async).
+    Integration: Retrieve live memory usage from MemoryModule.
+    Pure in-memory counting, so it runs inline rather than as a coroutine.
     """
-    await asyncio.sleep(0)  # Simulate async, replace with real async IO if needed
-    total = len(memory_mod.memories)
-    episodic = sum(1 for m in memory_mod.memories if m.get("type") == "episodic")
-    semantic = sum(1 for m in memory_mod.memories if m.get("type") == "semantic")
-    procedural = sum(1 for m in memory_mod.memories if m.get("type") == "procedural")
+    # One pass over the memories, counting every type at once
+    counts = collections.Counter(m.get("type") for m in memory_mod.memories)
     return {
-        "Total Memories": total,
-        "Episodic": episodic,
-        "Semantic": semantic,
-        "Procedural": procedural,
+        "Total Memories": len(memory_mod.memories),
+        "Episodic": counts["episodic"],
+        "Semantic": counts["semantic"],
+        "Procedural": counts["procedural"],
         "Last Pruned": "N/A"
     }
 
+# Raw analysis results for this file, shared by the analysis panel and
+# trigger_analysis. An unchanged mtime skips the read entirely; a changed mtime
+# with unchanged content (e.g. a touch) is caught by the content hash, so each
+# version of the source is analyzed once.
+_analysis_cache = {"mtime": None, "hash": None, "results": None}
+
+def invalidate_analysis_cache():
+    """Drop the cached analysis so the next read re-analyzes the source."""
+    _analysis_cache["mtime"] = None
+    _analysis_cache["hash"] = None
+    _analysis_cache["results"] = None
+    invalidate_panel_cache("get_latest_analysis_report")
+
+def _read_source():
+    with open(__file__, "r", encoding="utf-8") as f:
+        return f.read()
+
+async def _analyze_source():
+    """Analyze this file's source, reusing the last results while its mtime or content is unchanged."""
+    mtime = os.stat(__file__).st_mtime_ns
+    if _analysis_cache["mtime"] != mtime:
+        # Read in a worker thread so a cold disk read never stalls the event loop
+        code_str = await asyncio.to_thread(_read_source)
+        digest = hashlib.blake2b(code_str.encode("utf-8"), digest_size=16).digest()
+        if _analysis_cache.get("hash") != digest:
+            # CPU-bound; run it off the loop so panel refresh and input keep going
+            _analysis_cache["results"] = await asyncio.to_thread(analysis_mod.analyze_codebase, code_str)
+            _analysis_cache["hash"] = digest
+        _analysis_cache["mtime"] = mtime
+    return _analysis_cache["results"]
+
+def _format_details(details):
+    """Render analysis findings as the '- item' lines shown in the analysis panel."""
+    return "\n".join(f"- {d}" for d in details)
+
+@ttl_cache(seconds=60)
 async def get_latest_analysis_report():
     """
     Integration: Retrieve latest analysis report from AnalysisModule (async).
+    The report is reused until the analyzed source file changes on disk.
     """
-    await asyncio.sleep(0)  # Simulate async, replace with real async IO if needed
     try:
-        with open(__file__, "r", encoding="utf-8") as f:
-            code_str = f.read()
-        results = analysis_mod.analyze_codebase(code_str)
+        results = await _analyze_source()
         summary = "No critical issues." if not results.get("code_smells") else f"{len(results['code_smells'])} issues found."
-        details = results.get("code_smells", []) + results.get("deprecated_libs", [])
+        details = list(itertools.chain(results.get("code_smells", ()), results.get("deprecated_libs", ())))
         return {
             "Timestamp": "Live",
             "Summary": summary,
-            "Details": details
+            "Details": details,
+            # Pre-rendered bullet list, built once per cached report
+            "DetailsStr": _format_details(details)
         }
     except Exception as e:
         return {
             "Timestamp": "N/A",
             "Summary": f"Error: {e}",
-            "Details": []
+            "Details": [],
+            "DetailsStr": ""
         }
 
+@ttl_cache(seconds=5)
 async def get_pr_status():
     """
     Integration: Retrieve PR status using IntegrationModule (async).
     """
-    await asyncio.sleep(0)  # Simulate async, replace with real async IO if needed
     repo_url = "https://github.com/org/repo"
     pr_id = 42
-    status = integration_mod.monitor_pr_status(repo_url, pr_id)
+    # monitor_pr_status is blocking; run it in a worker thread so it overlaps
+    # with the other panel fetches instead of stalling the event loop.
+    status = await asyncio.to_thread(integration_mod.monitor_pr_status, repo_url, pr_id)
     return {
         "Open PRs": 1,
         "Last PR": {
@@ -158,15 +316,15 @@ async def get_pr_status():
         }
     }
 
-def trigger_analysis():
+async def trigger_analysis():
     """
-    Integration: Trigger analysis using AnalysisModule.
+    Integration: Trigger analysis using AnalysisModule (async).
     """
     console.print("[bold cyan]Triggering codebase analysis...[/bold cyan]\n[dim]This will scan the codebase for issues and deprecated libraries.[/dim]")
     try:
-        with open(__file__, "r", encoding="utf-8") as f:
-            code_str = f.read()
-        results = analysis_mod.analyze_codebase(code_str)
+        results = await _analyze_source()
+        # The panel's report may predate a file change; rebuild it from these results
+        invalidate_panel_cache("get_latest_analysis_report")
         msg = f"Analysis complete. Issues found: {len(results.get('code_smells', []))}, Deprecated libs: {len(results.get('deprecated_libs', []))}."
         if not results.get('code_smells') and not results.get('deprecated_libs'):
             msg += " No critical issues detected."
@@ -178,49 +336,99 @@ def trigger_analysis():
         audit_log("trigger_analysis_failed", details=str(e))
         return f"Analysis failed: {e}\n[red][Action Required][/red] Please check your codebase for syntax errors or missing dependencies.\n[dim]Tip: Try again after fixing the issue.[/dim]"
 
-def trigger_code_generation():
+async def trigger_code_generation():
     """
-    Integration: Trigger code generation using GenerationModule.
+    Integration: Trigger code generation using GenerationModule (async).
     """
     console.print("[bold cyan]Triggering code generation...[/bold cyan]\n[dim]This will generate code based on the latest analysis and memory context.[/dim]")
     # Use latest analysis and memory context for demo
-    analysis = get_latest_analysis_report()
+    analysis = await get_latest_analysis_report()
     memory_context = {"count": len(memory_mod.memories)}
     code = generation_mod.generate_code(analysis, memory_context)
     msg = f"Code generation complete. Preview:\n{code[:120]}..."
     audit_log("trigger_code_generation", details=msg)
     return msg + "\n[dim]Tip: Review the generated code before submitting a PR. If you encounter errors, check the analysis report for guidance.[/dim]"
 
+# Reviewers answer that clears a remembered reviewer list, since a blank
+# answer to a prompt with a default returns that default
+NO_REVIEWERS = "none"
+# Fields of the PR submission form, in prompt order: (key, label, default)
+PR_FORM_FIELDS = (
+    ("repo_url", "Repo URL", "https://github.com/org/repo"),
+    ("branch_name", "Branch name", "feature/auto-pr"),
+    ("prompt", "Prompt for code generation", "Improve X"),
+    ("reviewers", f"Reviewers (comma-separated, '{NO_REVIEWERS}' for none)", ""),
+    ("title", "PR Title (blank to auto-generate)", ""),
+)
+# Answers remembered in user preferences and offered as the next defaults
+PR_FORM_REMEMBERED = ("repo_url", "branch_name", "reviewers")
+
+def _pr_form_defaults(prefs):
+    """Form defaults, with last-used answers from `prefs` taking precedence."""
+    remembered = (prefs or {}).get("pr_form", {})
+    return {
+        key: remembered.get(key, default) if key in PR_FORM_REMEMBERED else default
+        for key, _, default in PR_FORM_FIELDS
+    }
+
+def _render_pr_form(defaults):
+    """Render the whole PR form with its defaults once, before any field is read."""
+    form = Table.grid(padding=(0, 2))
+    for key, label, _ in PR_FORM_FIELDS:
+        form.add_row(f"[bold]{label}[/bold]", defaults[key] or "[dim]-[/dim]")
+    return form
+
 @handle_errors("PR submission failed.")
-def trigger_pr_submission():
+async def trigger_pr_submission(prefs=None):
     """
-    Integration: Trigger PR submission using IntegrationModule.
+    Integration: Trigger PR submission using IntegrationModule (async).
+    If `prefs` (user preferences) is given, its remembered answers seed the
+    defaults and are updated after a successful submission.
     """
-    console.print("[bold cyan]Submitting a Pull Request...[/bold cyan]\n[dim]You will be prompted for repository details and reviewers.[/dim]")
-    repo_url = validate_repo_url(Prompt.ask("Repo URL", default="https://github.com/org/repo", show_default=True))
-    branch_name = validate_branch_name(Prompt.ask("Branch name", default="feature/auto-pr", show_default=True))
-    prompt_text = validate_prompt_text(Prompt.ask("Prompt for code generation", default="Improve X", show_default=True))
-    reviewers = []
-    if Prompt.ask("Assign reviewers? (y/n)", choices=["y", "n"], default="n", show_choices=True) == "y":
-        reviewers = validate_reviewers([r.strip() for r in Prompt.ask("Reviewers (comma-separated)", default="", show_default=True).split(",")])
-    auto = Prompt.ask("Auto-generate PR title/description? (y/n)", choices=["y", "n"], default="y", show_choices=True) == "y"
+    console.print(f"[bold cyan]Submitting a Pull Request...[/bold cyan]\n[dim]Press Enter to accept a default. Enter '{NO_REVIEWERS}' as reviewers to skip them and leave the title blank to auto-generate title/description.[/dim]")
+    defaults = _pr_form_defaults(prefs)
+    console.print(_render_pr_form(defaults))
+    answers = {}
+    for key, label, _ in PR_FORM_FIELDS:
+        answers[key] = await ask(label, default=defaults[key], show_default=bool(defaults[key]))
+    repo_url = validate_repo_url(answers["repo_url"])
+    branch_name = validate_branch_name(answers["branch_name"])
+    prompt_text = validate_prompt_text(answers["prompt"])
+    reviewers_answer = answers["reviewers"].strip()
+    if reviewers_answer.lower() == NO_REVIEWERS:
+        reviewers_answer = ""
+    reviewers = validate_reviewers([r.strip() for r in reviewers_answer.split(",")])
+    title = answers["title"].strip()
     # Generate PR metadata
-    analysis = get_latest_analysis_report()
-    if auto:
+    if not title:
+        analysis = await get_latest_analysis_report()
         title, description = integration_mod.generate_pr_metadata(analysis["Summary"], prompt_text)
     else:
-        title = Prompt.ask("PR Title", default="Automated PR", show_default=True)
-        description = Prompt.ask("PR Description", default="Auto-generated PR", show_default=True)
+        description = await ask("PR Description", default="Auto-generated PR", show_default=True)
     pr_id = integration_mod.create_pull_request(repo_url, branch_name, title, description)
-    if reviewers and reviewers != [""]:
+    if reviewers:
         integration_mod.assign_reviewers(repo_url, pr_id, reviewers)
+    invalidate_panel_cache("get_pr_status")
+    if prefs is not None:
+        prefs["pr_form"] = {"repo_url": repo_url, "branch_name": branch_name, "reviewers": ", ".join(reviewers)}
     msg = f"PR submitted successfully!\nTitle: {title}\nPR ID: {pr_id}\n[dim]Tip: View PR status in the dashboard or open the PR URL for details.[/dim]"
     audit_log("trigger_pr_submission", details={"repo_url": repo_url, "branch": branch_name, "pr_id": pr_id, "reviewers": reviewers})
     return msg
 
-async def render_memory_panel():
-    """Render the memory usage panel (async)."""
-    mem = await get_memory_usage()
+async def fetch_dashboard_summary():
+    """
+    Fetch everything the upper panels show in one call, as
+    {"memory": {...}, "analysis": {...}, "pr": {...}}; the analysis and PR
+    sources are read concurrently, memory counts are computed inline.
+    """
+    report, pr = await asyncio.gather(
+        get_latest_analysis_report(),
+        get_pr_status()
+    )
+    return {"memory": get_memory_usage(), "analysis": report, "pr": pr}
+
+def build_memory_panel(mem):
+    """Build the memory usage panel from already-fetched data."""
     if is_accessibility_mode():
         # Plain text, no color, ARIA-like cue
         lines = [f"[Section: Memory Usage]"]
@@ -232,24 +440,24 @@ async def render_memory_panel():
         table.add_row(f"[bold]{k}[/bold]", str(v))
     return Panel(table, title="Memory Usage", border_style="cyan")
 
-async def render_analysis_panel():
-    """Render the analysis report panel (async)."""
-    report = await get_latest_analysis_report()
+def build_analysis_panel(report):
+    """Build the analysis report panel from already-fetched data."""
+    details = report.get("DetailsStr")
+    if details is None:
+        details = _format_details(report["Details"])
     if is_accessibility_mode():
         lines = [f"[Section: Analysis Report]"]
         lines.append(f"Summary: {report['Summary']}")
         lines.append("Details:")
-        for d in report["Details"]:
-            lines.append(f"- {d}")
+        if details:
+            lines.append(details)
         body = "\n".join(lines)
         return Panel(body, title=f"Analysis Report ({report['Timestamp']})", border_style=None)
-    details = "\n".join(f"- {d}" for d in report["Details"])
     body = f"[bold]Summary:[/bold] {report['Summary']}\n[bold]Details:[/bold]\n{details}"
     return Panel(body, title=f"Analysis Report ({report['Timestamp']})", border_style="magenta")
 
-async def render_pr_panel():
-    """Render the PR status panel (async)."""
-    pr = await get_pr_status()
+def build_pr_panel(pr):
+    """Build the PR status panel from already-fetched data."""
     last = pr["Last PR"]
     if is_accessibility_mode():
         lines = [f"[Section: PR Status]"]
@@ -267,8 +475,32 @@ async def render_pr_panel():
     )
     return Panel(body, title="PR Status", border_style="green")
 
+# Upper-row panels in display order: (summary key / layout name, builder)
+UPPER_PANELS = (
+    ("memory", build_memory_panel),
+    ("analysis", build_analysis_panel),
+    ("pr", build_pr_panel),
+)
+
+async def render_memory_panel():
+    """Render the memory usage panel (async)."""
+    return build_memory_panel(get_memory_usage())
+
+async def render_analysis_panel():
+    """Render the analysis report panel (async)."""
+    return build_analysis_panel(await get_latest_analysis_report())
+
+async def render_pr_panel():
+    """Render the PR status panel (async)."""
+    return build_pr_panel(await get_pr_status())
+
+@functools.lru_cache(maxsize=1)
 def render_controls_panel():
-    """Render the controls panel for user actions, with contextual help."""
+    """
+    Render the controls panel for user actions, with contextual help.
+    Its content only depends on the import-time accessibility mode, so the
+    panel is built once and the same object is returned afterwards.
+    """
     help_line = "[dim]Tip: Enter the number or letter in [bold]brackets[/bold] to select an action. Press [bold]q[/bold] to quit at any time.[/dim]"
     if is_accessibility_mode():
         controls = (
@@ -304,72 +536,295 @@ def render_controls_panel():
     )
     return Panel(f"{controls}\n\n{doc}\n\n{help_line}", title="Controls", border_style="yellow")
 
-@handle_errors("Manual memory inject failed.")
-def manual_memory_inject():
-    """Prompt user for memory details and inject via API."""
-    console.print("[bold cyan]Manual Memory Inject[/bold cyan]\n[dim]Add a new memory entry. Choose type, enter text, and optionally provide metadata as JSON.[/dim]")
-    memory_type = validate_memory_type(Prompt.ask("Memory type", choices=["episodic", "semantic", "procedural"], default="semantic", show_choices=True, show_default=True))
-    text = validate_text(Prompt.ask("Memory text", show_default=False))
-    meta_str = Prompt.ask("Meta (JSON, optional)", default="{}", show_default=True)
-    meta = validate_meta(meta_str)
+# Live display drawing the dashboard while AsyncDashboardRunner.run() is active.
+# Live repaints its region from its own thread, which would draw over a prompt
+# and the user's typed answer, so ask() stops it while a prompt is up.
+_live_display = None
+_live_pauses = 0
+
+@contextlib.contextmanager
+def paused_live():
+    """Stop the running Live display for the duration of the block (nestable)."""
+    global _live_pauses
+    live = _live_display
+    if live is None:
+        yield
+        return
+    if _live_pauses == 0:
+        live.stop()
+    _live_pauses += 1
+    try:
+        yield
+    finally:
+        _live_pauses -= 1
+        if _live_pauses == 0:
+            live.start(refresh=True)
+
+async def _in_daemon_thread(func, *args, **kwargs):
+    """
+    Run a blocking call in a fresh daemon thread and await its result.
+    Unlike asyncio.to_thread, a call that never returns (input() after Ctrl-C)
+    does not keep asyncio.run() waiting on the default executor at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def target():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        else:
+            outcome = (future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # loop already closed; nobody is waiting
+
+    threading.Thread(target=target, name="sia-prompt", daemon=True).start()
+    return await future
+
+async def ask(*args, **kwargs):
+    """
+    Prompt.ask in a daemon worker thread, so the event loop keeps refreshing
+    panel data while the user types. Any running Live display is paused for the prompt.
+    """
+    with paused_live():
+        return await _in_daemon_thread(Prompt.ask, *args, **kwargs)
+
+# --- SIA API client ---
+# All API calls are coroutines sharing the aiohttp.ClientSession owned by
+# AsyncDashboardRunner.run(), so a slow request never blocks the render loop.
+API_BASE_URL = "http://localhost:8000"
+# aiohttp is imported on first use, not at module import, to keep startup fast
+# for entry points that never talk to the API.
+MEMORY_API_TIMEOUT = 5  # seconds
+PR_API_TIMEOUT = 10  # seconds
+
+@functools.lru_cache(maxsize=None)
+def _client_timeout(total):
+    """aiohttp.ClientTimeout for `total` seconds, built once per value."""
+    import aiohttp
+    return aiohttp.ClientTimeout(total=total)
+# Connection pool shared by every API call: a few kept-alive connections to the
+# one API host instead of a fresh TCP handshake per request.
+API_CONNECTION_LIMIT = 10
+API_KEEPALIVE_TIMEOUT = 30
+
+def _auth_headers():
+    """Build request headers, adding the bearer token only when one is configured."""
     headers = {}
     if API_TOKEN:
         headers["Authorization"] = f"Bearer {API_TOKEN}"
-    resp = requests.post(
-        "http://localhost:8000/memory/manual_inject",
-        json={"text": text, "meta": meta, "memory_type": memory_type},
-        headers=headers,
-        timeout=5
+    return headers
+
+def create_api_session():
+    """Create the dashboard's shared aiohttp session (call from inside the running loop)."""
+    import aiohttp
+    connector = aiohttp.TCPConnector(limit=API_CONNECTION_LIMIT, keepalive_timeout=API_KEEPALIVE_TIMEOUT)
+    # Auth header and the memory-call timeout apply to every request; slower
+    # PR actions override the timeout per request.
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=_auth_headers(),
+        timeout=_client_timeout(MEMORY_API_TIMEOUT)
+    )
+
+# Largest memory-retrieve body the dashboard will read; it is streamed in
+# chunks and rejected as soon as it grows past this.
+MAX_MEMORY_RESPONSE_BYTES = 1 << 20
+_RESPONSE_CHUNK_BYTES = 64 * 1024
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Ask for msgpack (faster to decode, smaller on the wire) only when we can read it
+MEMORY_ACCEPT = f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9" if msgpack is not None else "application/json"
+
+class ResponseTooLargeError(ValueError):
+    """A streamed response body grew past the size limit before it was fully read."""
+    def __init__(self, limit):
+        super().__init__(f"Response exceeds the {limit} byte limit.")
+        self.limit = limit
+
+async def _read_payload_capped(resp, limit=None):
+    """
+    Stream a response body in chunks, refusing bodies over `limit` bytes, and
+    decode it once as msgpack or JSON according to its Content-Type.
+    """
+    if limit is None:
+        limit = MAX_MEMORY_RESPONSE_BYTES
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(_RESPONSE_CHUNK_BYTES):
+        body += chunk
+        if len(body) > limit:
+            raise ResponseTooLargeError(limit)
+    if msgpack is not None and resp.content_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.unpackb(bytes(body), raw=False)
+    return json.loads(body)
+
+def _inject_request(session, memory_type, text, meta):
+    """Start a manual-inject POST; use the result as an async context manager."""
+    return session.post(
+        f"{API_BASE_URL}/memory/manual_inject",
+        json={"text": text, "meta": meta, "memory_type": memory_type}
     )
-    if resp.ok:
+
+@handle_errors("Manual memory inject failed.")
+async def manual_memory_inject(session):
+    """Prompt user for memory details and inject via API."""
+    console.print("[bold cyan]Manual Memory Inject[/bold cyan]\n[dim]Add a new memory entry. Choose type, enter text, and optionally provide metadata as JSON.[/dim]")
+    memory_type = validate_memory_type(await ask("Memory type", choices=["episodic", "semantic", "procedural"], default="semantic", show_choices=True, show_default=True))
+    text = validate_text(await ask("Memory text", show_default=False))
+    meta_str = await ask("Meta (JSON, optional)", default="{}", show_default=True)
+    meta = validate_meta(meta_str)
+    async with _inject_request(session, memory_type, text, meta) as resp:
+        if not resp.ok:
+            # Never log or expose secrets/tokens in error messages
+            return format_error_message(
+                "API error",
+                "Error injecting memory. [Action Required] The API server returned an error.\n[dim]Tip: Check API server status, logs, or try again.[/dim]"
+            )
         try:
-            idx = resp.json().get("index")
-            return f"Memory injected at index {idx}.\n[dim]Tip: Use [5] to retrieve this memory by index.[/dim]"
+            idx = (await resp.json()).get("index")
         except Exception:
             return format_error_message(
                 "Invalid response from API.",
                 "Error injecting memory. [Action Required] Please check the API server response format.\n[dim]Tip: Ensure the API server is running and reachable.[/dim]"
             )
-        else:
-            # Never log or expose secrets/tokens in error messages
-            return format_error_message(
-                "API error",
-                "Error injecting memory. [Action Required] The API server returned an error.\n[dim]Tip: Check API server status, logs, or try again.[/dim]"
-            )
+    audit_log("manual_memory_inject", details={"memory_type": memory_type, "index": idx})
+    invalidate_panel_cache("get_memory_usage")
+    return f"Memory injected at index {idx}.\n[dim]Tip: Use [5] to retrieve this memory by index.[/dim]"
+
+# Most manual-inject requests batch_inject keeps in flight at once; below
+# API_CONNECTION_LIMIT so a burst never takes every pooled connection.
+BATCH_INJECT_CONCURRENCY = 8
+
+async def batch_inject(session, items, concurrency=None):
+    """
+    Inject many memories concurrently, with at most `concurrency` requests in flight.
+    Each item is a dict with "text" and optional "meta" (dict) and "memory_type".
+    Every item is validated before any request is sent. Returns the new indices
+    in input order; raises on the first failed request.
+    """
+    payloads = [
+        (
+            validate_memory_type(item.get("memory_type", "semantic")),
+            validate_text(item["text"]),
+            item.get("meta") or {},
+        )
+        for item in items
+    ]
+    sem = asyncio.Semaphore(concurrency or BATCH_INJECT_CONCURRENCY)
+
+    async def inject_one(memory_type, text, meta):
+        async with sem:
+            async with _inject_request(session, memory_type, text, meta) as resp:
+                if not resp.ok:
+                    raise RuntimeError("API error while injecting memory.")
+                return (await resp.json()).get("index")
+
+    indices = await asyncio.gather(*(inject_one(*p) for p in payloads))
+    audit_log("batch_inject", details={"count": len(indices)})
+    invalidate_panel_cache("get_memory_usage")
+    return indices
 
 @handle_errors("Manual memory retrieve failed.")
-def manual_memory_retrieve():
+async def manual_memory_retrieve(session):
     """Prompt user for memory index and retrieve via API."""
     console.print("[bold cyan]Manual Memory Retrieve[/bold cyan]\n[dim]Retrieve a memory entry by its index. Index must be a non-negative integer.[/dim]")
-    idx = validate_index(Prompt.ask("Memory index", default="0", show_default=True))
-    headers = {}
-    if API_TOKEN:
-        headers["Authorization"] = f"Bearer {API_TOKEN}"
-    resp = requests.get(
-        f"http://localhost:8000/memory/manual_retrieve?idx={idx}",
-        headers=headers,
-        timeout=5
-    )
-    if resp.ok:
+    idx = validate_index(await ask("Memory index", default="0", show_default=True))
+    async with session.get(
+        f"{API_BASE_URL}/memory/manual_retrieve",
+        params={"idx": idx},
+        headers={"Accept": MEMORY_ACCEPT}
+    ) as resp:
+        if not resp.ok:
+            # Never log or expose secrets/tokens in error messages
+            return format_error_message(
+                "API error",
+                "Error retrieving memory. [Action Required] The API server returned an error.\n[dim]Tip: Check API server status, logs, or try again.[/dim]"
+            )
+        if resp.content_length is not None and resp.content_length > MAX_MEMORY_RESPONSE_BYTES:
+            return format_error_message(
+                f"Response of {resp.content_length} bytes exceeds the {MAX_MEMORY_RESPONSE_BYTES} byte limit.",
+                "Error retrieving memory. [Action Required] The memory is too large to display here.\n[dim]Tip: Query the API directly for large memories.[/dim]"
+            )
         try:
-            mem = resp.json().get("memory")
-            if mem:
-                # Sanitize output: never display secrets
-                mem_sanitized = {k: ("***" if "secret" in k.lower() or "token" in k.lower() else v) for k, v in mem.items()}
-                return f"Memory[{idx}]:\n{json.dumps(mem_sanitized, indent=2)}\n[dim]Tip: Use [4] to inject new memory.[/dim]"
-            else:
-                return f"No memory found at index {idx}.\n[dim]Tip: Use [4] to inject new memory.[/dim]"
+            mem = (await _read_payload_capped(resp)).get("memory")
+        except ResponseTooLargeError as e:
+            # No (or a lying) Content-Length: the cap was hit while streaming
+            return format_error_message(
+                str(e),
+                "Error retrieving memory. [Action Required] The memory is too large to display here.\n[dim]Tip: Query the API directly for large memories.[/dim]"
+            )
         except Exception:
             return format_error_message(
                 "Invalid response from API.",
                 "Error retrieving memory. [Action Required] Please check the API server response format.\n[dim]Tip: Ensure the API server is running and reachable.[/dim]"
             )
+    audit_log("manual_memory_retrieve", details={"index": idx})
+    if mem:
+        # Sanitize output: never display secrets
+        mem_sanitized = {k: ("***" if _SANITIZE_KEY_RE.search(k) else v) for k, v in mem.items()}
+        if orjson is not None:
+            body = orjson.dumps(mem_sanitized, option=orjson.OPT_INDENT_2).decode("utf-8")
         else:
-            # Never log or expose secrets/tokens in error messages
-            return format_error_message(
-                "API error",
-                "Error retrieving memory. [Action Required] The API server returned an error.\n[dim]Tip: Check API server status, logs, or try again.[/dim]"
-            )
+            body = json.dumps(mem_sanitized, indent=2)
+        return f"Memory[{idx}]:\n{body}\n[dim]Tip: Use [4] to inject new memory.[/dim]"
+    return f"No memory found at index {idx}.\n[dim]Tip: Use [4] to inject new memory.[/dim]"
+
+async def _post_pr_action(session, action, pr_id, done_msg, error_msg):
+    """POST a PR action (approve/rollback) and return a UI-safe result message."""
+    pr_id_valid = validate_pr_id(pr_id)
+    async with session.post(
+        f"{API_BASE_URL}/pr/{action}",
+        json={"pr_id": pr_id_valid},
+        timeout=_client_timeout(PR_API_TIMEOUT)
+    ) as resp:
+        if not resp.ok:
+            return format_error_message("API error", error_msg)
+        try:
+            result = (await resp.json()).get("result", done_msg)
+        except Exception:
+            return format_error_message("Invalid response from API.", error_msg)
+    audit_log(f"pr_{action}", details={"pr_id": pr_id_valid})
+    invalidate_panel_cache("get_pr_status")
+    # Never expose secrets/tokens in UI
+    if isinstance(result, str) and ("token" in result.lower() or "secret" in result.lower()):
+        return done_msg
+    return result
+
+@handle_errors("PR approval failed.")
+async def approve_pr(session, pr_id):
+    """Approve/merge a pull request via API."""
+    return await _post_pr_action(session, "approve", pr_id, "Approved.", "Error approving PR.")
+
+@handle_errors("PR rollback failed.")
+async def rollback_pr(session, pr_id):
+    """Revert a pull request via API."""
+    return await _post_pr_action(session, "rollback", pr_id, "Rolled back.", "Error rolling back PR.")
+# --- End SIA API client ---
+
+# Terminal repaint rate of the Live display; panel data refreshes separately.
+LIVE_REFRESH_PER_SECOND = 4
+
+# Static panels, built once at import instead of on every layout update.
+CONTROLS_PANEL = render_controls_panel()
+IDLE_MSG = "Select an action from Controls above."
+# Persistent help line shown below every feedback message
+FEEDBACK_HELP_LINE = Text("Need help? Press the number/letter in brackets for any action. [q] to quit.", style="dim", justify="center")
+
+def build_feedback_panel(msg):
+    """Build the lower feedback panel for an action result message."""
+    return Panel(Text(msg, justify="center") + "\n" + FEEDBACK_HELP_LINE, border_style="white")
+
+IDLE_FEEDBACK_PANEL = build_feedback_panel(IDLE_MSG)
+
+# Dashboard state and preferences are written at most this often while running.
+SAVE_DEBOUNCE_SECONDS = 2
 
 class AsyncDashboardRunner:
     """Modular async dashboard runner for testability and live refresh."""
@@ -384,109 +839,121 @@ class AsyncDashboardRunner:
             Layout(name="middle", size=13),
             Layout(name="lower", ratio=1)
         )
-        self.layout["middle"].update(render_controls_panel())
-        last_msg = self.dashboard_state.get("last_msg", "Select an action from Controls above.")
-        # Add a persistent help line below the feedback message
-        help_line = Text("Need help? Press the number/letter in brackets for any action. [q] to quit.", style="dim", justify="center")
-        feedback_panel = Panel(Text(last_msg, justify="center") + "\n" + help_line, border_style="white")
-        self.layout["lower"].update(feedback_panel)
+        # Split the upper row once; refreshes only swap the panels inside it.
+        self.layout["upper"].split_row(*(Layout(name=name) for name, _ in UPPER_PANELS))
+        self.layout["middle"].update(CONTROLS_PANEL)
+        self._last_msg = self.dashboard_state.get("last_msg", IDLE_MSG)
+        self.layout["lower"].update(IDLE_FEEDBACK_PANEL if self._last_msg == IDLE_MSG else build_feedback_panel(self._last_msg))
         self.running = True
+        # Shared HTTP session for SIA API calls; opened for the lifetime of run()
+        self.session = None
+        # Set when state/prefs changed since the last write
+        self._dirty = False
+        # Last data shown in each upper panel and the Panel built from it
+        self._panel_data = {}
+        self._panels = {}
 
     async def refresh_panels(self, interval=2):
         while self.running:
-            mem_panel, analysis_panel, pr_panel = await asyncio.gather(
-                render_memory_panel(),
-                render_analysis_panel(),
-                render_pr_panel()
-            )
-            self.layout["upper"].split_row(
-                Layout(mem_panel, name="memory"),
-                Layout(analysis_panel, name="analysis"),
-                Layout(pr_panel, name="pr"),
-            )
+            # All I/O happens in one concurrent fetch; panel building is pure CPU.
+            try:
+                summary = await fetch_dashboard_summary()
+            except Exception:
+                # Keep the last panels and try again next cycle rather than
+                # letting the task die and the panels freeze for the session.
+                logging.getLogger(__name__).error("Failed to refresh dashboard panels.", exc_info=True)
+                await asyncio.sleep(interval)
+                continue
+            for name, build in UPPER_PANELS:
+                # Like a 304 Not Modified: keep the existing panel when its data is unchanged
+                if name in self._panels and self._panel_data.get(name) == summary[name]:
+                    continue
+                self._panel_data[name] = summary[name]
+                self._panels[name] = build(summary[name])
+                self.layout[name].update(self._panels[name])
             await asyncio.sleep(interval)
 
+    async def save_state(self):
+        """Write dashboard state and user preferences now, off the event loop."""
+        self._dirty = False
+        # Snapshot first so later edits can't race the write in the worker thread
+        state, prefs = dict(self.dashboard_state), dict(self.user_prefs)
+        await asyncio.to_thread(save_dashboard_state, state)
+        await asyncio.to_thread(save_user_preferences, prefs)
+
+    async def _periodic_save(self, interval=None):
+        """Flush pending state changes every `interval` seconds while running."""
+        interval = SAVE_DEBOUNCE_SECONDS if interval is None else interval
+        while self.running:
+            await asyncio.sleep(interval)
+            if self._dirty:
+                await self.save_state()
+
     async def user_input_loop(self):
         while self.running:
-            await asyncio.sleep(0.1)
-            console.clear()
-            console.print(self.layout)
-            choice = Prompt.ask("\nEnter choice", choices=["1", "2", "3", "4", "5", "6", "7", "q"], default="q")
+            # Only the prompts themselves pause the Live display (see ask());
+            # it keeps redrawing while an action runs, and console.print output
+            # from the action scrolls above it.
+            choice = await ask("\nEnter choice", choices=["1", "2", "3", "4", "5", "6", "7", "q"], default="q")
             msg = ""
             if choice == "1":
-                msg = trigger_analysis()
+                msg = await trigger_analysis()
             elif choice == "2":
-                msg = trigger_code_generation()
+                msg = await trigger_code_generation()
             elif choice == "3":
-                msg = trigger_pr_submission()
+                msg = await trigger_pr_submission(self.user_prefs)
             elif choice == "4":
-                msg = manual_memory_inject()
+                msg = await manual_memory_inject(self.session)
             elif choice == "5":
-                msg = manual_memory_retrieve()
+                msg = await manual_memory_retrieve(self.session)
             elif choice == "6":
-                pr_id = Prompt.ask("Enter PR ID to approve/merge", default="1")
-                @handle_errors("PR approval failed.")
-                def approve_pr(pr_id):
-                    pr_id_valid = validate_pr_id(pr_id)
-                    resp = requests.post(
-                        "http://localhost:8000/pr/approve",
-                        json={"pr_id": pr_id_valid},
-                        timeout=10
-                    )
-                    if resp.ok:
-                        try:
-                            result = resp.json().get("result", "Approved.")
-                            # Never expose secrets/tokens in UI
-                            if isinstance(result, str) and ("token" in result.lower() or "secret" in result.lower()):
-                                return "Approved."
-                            return result
-                        except Exception:
-                            return format_error_message("Invalid response from API.", "Error approving PR.")
-                    else:
-                        return format_error_message("API error", "Error approving PR.")
-                msg = approve_pr(pr_id)
+                pr_id = await ask("Enter PR ID to approve/merge", default="1")
+                msg = await approve_pr(self.session, pr_id)
             elif choice == "7":
-                pr_id = Prompt.ask("Enter PR ID to rollback", default="1")
-                @handle_errors("PR rollback failed.")
-                def rollback_pr(pr_id):
-                    pr_id_valid = validate_pr_id(pr_id)
-                    resp = requests.post(
-                        "http://localhost:8000/pr/rollback",
-                        json={"pr_id": pr_id_valid},
-                        timeout=10
-                    )
-                    if resp.ok:
-                        try:
-                            result = resp.json().get("result", "Rolled back.")
-                            # Never expose secrets/tokens in UI
-                            if isinstance(result, str) and ("token" in result.lower() or "secret" in result.lower()):
-                                return "Rolled back."
-                            return result
-                        except Exception:
-                            return format_error_message("Invalid response from API.", "Error rolling back PR.")
-                    else:
-                        return format_error_message("API error", "Error rolling back PR.")
-                msg = rollback_pr(pr_id)
+                pr_id = await ask("Enter PR ID to rollback", default="1")
+                msg = await rollback_pr(self.session, pr_id)
             elif choice == "q":
                 console.print("\n[bold green]Exiting dashboard.[/bold green]")
                 self.dashboard_state["last_msg"] = "Exited dashboard."
-                save_dashboard_state(self.dashboard_state)
-                save_user_preferences(self.user_prefs)
+                await self.save_state()
                 self.running = False
-                sys.exit(0)
+                break
             self.dashboard_state["last_choice"] = choice
             self.dashboard_state["last_msg"] = msg
-            save_dashboard_state(self.dashboard_state)
-            save_user_preferences(self.user_prefs)
-            help_line = Text("Need help? Press the number/letter in brackets for any action. [q] to quit.", style="dim", justify="center")
-            feedback_panel = Panel(Text(msg, justify="center") + "\n" + help_line, border_style="white")
-            self.layout["lower"].update(feedback_panel)
+            # Written by _periodic_save, at most once per SAVE_DEBOUNCE_SECONDS
+            self._dirty = True
+            if msg != self._last_msg:
+                # Picked up by Live on its next refresh
+                self._last_msg = msg
+                self.layout["lower"].update(build_feedback_panel(msg))
 
     async def run(self):
-        await asyncio.gather(
-            self.refresh_panels(),
-            self.user_input_loop()
-        )
+        global _live_display
+        from rich.live import Live
+        async with create_api_session() as session:
+            self.session = session
+            # Live redraws on its own cadence while refresh_panels updates the
+            # layout in the background. It draws inline rather than on the
+            # alternate screen so a paused frame stays visible above prompts.
+            with Live(self.layout, console=console, refresh_per_second=LIVE_REFRESH_PER_SECOND) as live:
+                _live_display = live
+                tasks = [
+                    asyncio.create_task(self.refresh_panels()),
+                    asyncio.create_task(self._periodic_save()),
+                ]
+                try:
+                    await self.user_input_loop()
+                finally:
+                    # Quit (or Ctrl-C) stops the background tasks at once instead
+                    # of waiting out their sleeps; leaving the `async with` then
+                    # closes the session's pooled connections.
+                    self.running = False
+                    _live_display = None
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    if self._dirty:
+                        await self.save_state()
 
 async def dashboard():
     """Main dashboard entrypoint (async, modular)."""
@@ -5,6 +5,14 @@ Validation utilities for SIA Dashboard UI.
 import json
 import re
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_REPO_URL_RE = re.compile(r"^https://github\.com/[\w\-]+/[\w\-]+$")
+
 def validate_memory_type(memory_type):
     if memory_type not in {"episodic", "semantic", "procedural"}:
         raise ValueError("Invalid memory type. Must be episodic, semantic, or procedural.")
@@ -19,7 +27,7 @@ def validate_meta(meta_str):
     if not meta_str.strip():
         return {}
     try:
-        meta = json.loads(meta_str)
+        meta = _loads(meta_str)
         if not isinstance(meta, dict):
             raise ValueError("Meta must be a JSON object.")
         return meta
@@ -27,17 +35,13 @@ def validate_meta(meta_str):
         raise ValueError("Meta must be valid JSON.")
 
 def validate_index(idx):
-    try:
-        idx_int = int(idx)
-        if idx_int < 0:
-            raise ValueError("Index must be non-negative.")
-        return idx_int
-    except Exception:
+    s = str(idx).strip()
+    if not s.isdecimal():
         raise ValueError("Index must be a non-negative integer.")
+    return int(s)
 
 def validate_repo_url(url):
-    pattern = r"^https://github\.com/[\w\-]+/[\w\-]+$"
-    if not re.match(pattern, url):
+    if not _REPO_URL_RE.match(url):
         raise ValueError("Repo URL must be a valid GitHub repository URL.")
     return url
 
@@ -54,16 +58,17 @@ def validate_prompt_text(prompt_text):
 def validate_reviewers(reviewers):
     if not isinstance(reviewers, list):
         raise ValueError("Reviewers must be a list.")
+    out = []
     for r in reviewers:
-        if r and not isinstance(r, str):
+        if not r:
+            continue
+        if not isinstance(r, str):
             raise ValueError("Each reviewer must be a string.")
-    return [r for r in reviewers if r]
+        out.append(r)
+    return out
 
 def validate_pr_id(pr_id):
-    try:
-        pr_id_int = int(pr_id)
-        if pr_id_int < 1:
-            raise ValueError("PR ID must be a positive integer.")
-        return pr_id_int
-    except Exception:
-        raise ValueError("PR ID must be a positive integer.")
\ No newline at end of file
+    s = str(pr_id).strip().lstrip("+")
+    if not s.isdecimal() or int(s) < 1:
+        raise ValueError("PR ID must be a positive integer.")
+    return int(s)
\ No newline at end of file